@@ -3,12 +3,28 @@
 Protonion MCP Jira Agent - Standalone Version
 Simple, robust, and portable
 """
+import atexit
+import base64
+import functools
+import importlib.util
+import itertools
 import os
+import re
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dotenv import load_dotenv, set_key
+from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
-import requests
-from typing import Dict, List
+import httpx
+from typing import Callable, Dict, List
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding of API bodies
+except ImportError:
+    orjson = None
 
 # Load environment
 load_dotenv()
@@ -19,6 +35,25 @@ JIRA_USER = os.getenv("JIRA_USER", "")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN", "")
 JIRA_PROJECT_KEY = os.getenv("JIRA_PROJECT_KEY", "CRM")
 
+# Latency samples (method, endpoint, seconds) for the last Jira calls
+_LATENCY_RING = deque(maxlen=512)
+_ISSUE_KEY_IN_PATH = re.compile(r"[A-Z][A-Z0-9]+-\d+")
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.3
+# Upper bound on a server-sent Retry-After so a throttled call can't hang a tool
+_RETRY_AFTER_MAX = 10.0
+
+# Shared I/O pool for concurrent Jira calls (pagination, paired writes)
+_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="jira-io")
+atexit.register(_POOL.shutdown, wait=False)
+
+# Fields rendered by inspect_task; Jira returns every custom field otherwise
+ISSUE_DETAIL_FIELDS = "summary,status,priority,assignee,description"
+
 # Initialize FastMCP
 mcp = FastMCP(
     "protonion",
@@ -57,62 +92,280 @@ Professional Jira integration for high-performance teams.
 """
 
 
+class JiraError(Exception):
+    """Jira API request failed"""
+
+
+class JiraAuthError(JiraError):
+    """Jira rejected the configured credentials"""
+
+
+class JiraNotFound(JiraError):
+    """Requested Jira resource does not exist (or is not visible)"""
+    
+    def __init__(self, endpoint: str):
+        super().__init__(f"Not found: {endpoint}")
+
+
+_MISSING = object()
+
+
+def _adf(text: str) -> Dict:
+    """Wrap plain text in a single-paragraph Atlassian Document Format body"""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]
+    }
+
+
+def _decode(response: httpx.Response):
+    """Decode a JSON body (orjson when available; Accept pins JSON so no sniffing)"""
+    if not response.content:
+        return {}
+    return orjson.loads(response.content) if orjson is not None else response.json()
+
+
+def _adf_text(desc, cap: int = 200) -> str:
+    """Plain text of an ADF document, walking only until `cap` characters are collected"""
+    if not isinstance(desc, dict):
+        return "No description"
+    
+    buf, n = [], 0
+    stack = list(reversed(desc.get("content", [])))
+    while stack and n < cap:
+        node = stack.pop()
+        node_type = node.get("type")
+        if node_type == "text":
+            text = node.get("text", "")
+            buf.append(text)
+            n += len(text)
+        elif node_type == "hardBreak" or (buf and not buf[-1].endswith(" ")):
+            # Separate blocks (paragraphs, list items, ...) like the old " ".join did
+            buf.append(" ")
+            n += 1
+        stack.extend(reversed(node.get("content", [])))
+    
+    text = "".join(buf).strip()[:cap]
+    return text or "No description"
+
+
+class _TTLCache:
+    """Size-bounded TTL cache (keeps the agent free of a cachetools dependency)"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return default
+        return value
+    
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Evict the oldest insertion
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+    
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+    
+    def pop_matching(self, predicate: Callable) -> None:
+        """Drop every entry whose key satisfies `predicate`"""
+        for key in [k for k in list(self._data) if predicate(k)]:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Available transitions per issue (they depend on the issue's current status)
+_TRANS_CACHE = _TTLCache(maxsize=256, ttl=300)
+# Issue payloads keyed by (issue_key, fields) for inspect -> move -> inspect flows
+_ISSUE_CACHE = _TTLCache(maxsize=512, ttl=60)
+
+
+def _invalidate_issue(issue_key: str) -> None:
+    """Forget every cached view of an issue after we changed it"""
+    _ISSUE_CACHE.pop_matching(lambda key: key[0] == issue_key)
+
+
+def _transitions_by_name(transitions: List[Dict]) -> Dict[str, Dict]:
+    """Casefolded target status -> transition; reversed so the first duplicate wins"""
+    return {t["to"]["name"].casefold(): t for t in reversed(transitions)}
+
+
 class JiraClient:
     """Simple Jira API client"""
     
     def __init__(self):
         self.base_url = JIRA_URL.rstrip('/')
-        self.session = requests.Session()
-        self.session.auth = (JIRA_USER, JIRA_API_TOKEN)
-        self.session.headers.update({
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        })
+        self._api3 = "/rest/api/3/"
+        self._agile = "/rest/agile/1.0/"
+        # Basic auth header built once instead of running an auth flow per request
+        token = base64.b64encode(f"{JIRA_USER}:{JIRA_API_TOKEN}".encode()).decode()
+        # HTTP/2 lets paired calls share one TLS connection; no custom transport,
+        # so HTTP(S)_PROXY/NO_PROXY still apply. _send handles retries
+        self.session = httpx.Client(
+            base_url=self.base_url,
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "Authorization": f"Basic {token}"
+            },
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+    
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send request recording its latency in the ring buffer"""
+        endpoint = _ISSUE_KEY_IN_PATH.sub("{key}", url)
+        t0 = time.perf_counter()
+        try:
+            for attempt in range(_MAX_RETRIES + 1):
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except (httpx.ConnectError, httpx.ConnectTimeout):
+                    # Nothing reached the server, so even a POST is safe to resend
+                    if attempt == _MAX_RETRIES:
+                        raise
+                    time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                status = response.status_code
+                # POSTs are only replayed on 429 (never processed) to avoid duplicates
+                if (
+                    status not in _RETRY_STATUSES
+                    or attempt == _MAX_RETRIES
+                    or (method == "POST" and status != 429)
+                ):
+                    return response
+                retry_after = response.headers.get("Retry-After", "")
+                time.sleep(
+                    min(int(retry_after), _RETRY_AFTER_MAX) if retry_after.isdigit()
+                    else _RETRY_BACKOFF * 2 ** attempt
+                )
+        finally:
+            _LATENCY_RING.append((method, endpoint, time.perf_counter() - t0))
     
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
         """Make API request"""
-        url = f"{self.base_url}/rest/api/3/{endpoint}"
+        if orjson is not None and "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
         try:
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json() if response.content else {}
-        except Exception as e:
-            raise Exception(f"Jira API Error: {str(e)}")
+            response = self._send(method, self._api3 + endpoint, **kwargs)
+        except httpx.HTTPError as e:
+            raise JiraError(f"Jira unreachable: {e}") from e
+        
+        if response.status_code == 401:
+            raise JiraAuthError(f"Authentication failed, check JIRA_USER/JIRA_API_TOKEN: {response.text[:200]}")
+        if response.status_code == 404:
+            raise JiraNotFound(endpoint)
+        if response.is_error:
+            raise JiraError(f"HTTP {response.status_code}: {response.text[:200]}")
+        return _decode(response)
     
-    def get_board_issues(self, board_id: int, jql: str = None) -> List[Dict]:
-        """Get issues from board"""
-        url = f"{self.base_url}/rest/agile/1.0/board/{board_id}/issue"
-        params = {"jql": jql} if jql else {}
-        try:
-            response = self.session.get(url, params=params)
+    def _fetch_pages_parallel(self, fetch_page: Callable[[Dict], Dict], base_params: Dict,
+                              limit: int, batch: int = 100) -> List[Dict]:
+        """Fetch up to `limit` issues: first page discovers `total`, the rest run concurrently"""
+        first = fetch_page({**base_params, "startAt": 0, "maxResults": min(batch, limit)})
+        issues = list(first.get("issues", []))
+        total = min(first.get("total", 0), limit)
+        # Jira may cap maxResults below what we asked for; step by what it actually served
+        page_size = first.get("maxResults") or len(issues)
+        if not page_size or len(issues) >= total:
+            return issues[:limit]
+        
+        starts = range(page_size, total, page_size)
+        pages = _POOL.map(
+            lambda start: fetch_page({
+                **base_params,
+                "startAt": start,
+                "maxResults": min(page_size, total - start)
+            }),
+            starts
+        )
+        for page in pages:
+            issues.extend(page.get("issues", []))
+        return issues[:limit]
+    
+    def get_board_issues(self, board_id: int, jql: str = None, max_results: int = None,
+                         fields: str = "summary,status") -> List[Dict]:
+        """Get issues from board (all pages up to max_results when given)"""
+        url = f"{self._agile}board/{board_id}/issue"
+        params = {"fields": fields}
+        if jql:
+            params["jql"] = jql
+        
+        def fetch_page(page_params: Dict) -> Dict:
+            response = self._send("GET", url, params=page_params)
             response.raise_for_status()
-            return response.json().get("issues", [])
+            return _decode(response)
+        
+        try:
+            if max_results is None:
+                return fetch_page(params).get("issues", [])
+            return self._fetch_pages_parallel(fetch_page, params, max_results)
         except:
             return []
     
-    def get_issue(self, issue_key: str) -> Dict:
-        """Get issue details"""
-        return self._request("GET", f"issue/{issue_key}")
+    def get_issue(self, issue_key: str, fields: str = ISSUE_DETAIL_FIELDS) -> Dict:
+        """Get issue details (only the requested fields; pass "*all" for everything)"""
+        key = (issue_key, fields)
+        issue = _ISSUE_CACHE.get(key)
+        if issue is None:
+            issue = _ISSUE_CACHE[key] = self._request("GET", f"issue/{issue_key}", params={"fields": fields})
+        return issue
     
     def search_issues(self, jql: str, max_results: int = 50) -> List[Dict]:
         """Search issues"""
         params = {
             "jql": jql,
-            "maxResults": max_results,
             "fields": "summary,status,assignee,priority,created"
         }
-        result = self._request("GET", "search", params=params)
-        return result.get("issues", [])
+        return self._fetch_pages_parallel(
+            lambda page_params: self._request("GET", "search", params=page_params),
+            params,
+            max_results
+        )
     
     def get_transitions(self, issue_key: str) -> List[Dict]:
-        """Get available transitions"""
-        result = self._request("GET", f"issue/{issue_key}/transitions")
-        return result.get("transitions", [])
+        """Get available transitions (cached until the issue moves)"""
+        transitions = _TRANS_CACHE.get(issue_key)
+        if transitions is None:
+            result = self._request("GET", f"issue/{issue_key}/transitions")
+            transitions = _TRANS_CACHE[issue_key] = result.get("transitions", [])
+        return transitions
     
     def transition_issue(self, issue_key: str, transition_id: str) -> None:
         """Transition issue"""
         data = {"transition": {"id": transition_id}}
-        self._request("POST", f"issue/{issue_key}/transitions", json=data)
+        try:
+            self._request("POST", f"issue/{issue_key}/transitions", json=data)
+        finally:
+            # New status means a different set of legal transitions; a rejected
+            # id usually means the cached list (and issue) were already stale
+            _TRANS_CACHE.pop(issue_key, None)
+            _invalidate_issue(issue_key)
     
     def create_issue(self, summary: str, description: str, issue_type: str = "Task") -> Dict:
         """Create new issue"""
@@ -120,14 +373,7 @@ class JiraClient:
             "fields": {
                 "project": {"key": JIRA_PROJECT_KEY},
                 "summary": summary,
-                "description": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [{
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": description}]
-                    }]
-                },
+                "description": _adf(description),
                 "issuetype": {"name": issue_type}
             }
         }
@@ -135,46 +381,61 @@ class JiraClient:
     
     def add_comment(self, issue_key: str, comment: str) -> Dict:
         """Add comment to issue"""
-        data = {
-            "body": {
-                "type": "doc",
-                "version": 1,
-                "content": [{
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": comment}]
-                }]
-            }
-        }
-        return self._request("POST", f"issue/{issue_key}/comment", json=data)
+        data = {"body": _adf(comment)}
+        result = self._request("POST", f"issue/{issue_key}/comment", json=data)
+        _invalidate_issue(issue_key)
+        return result
     
-    def search_users(self, query: str, max_results: int = 10) -> List[Dict]:
-        """Search users"""
+    def _search_users_raw(self, query: str, max_results: int) -> List[Dict]:
         params = {"query": query, "maxResults": max_results}
         return self._request("GET", "user/search", params=params)
+    
+    def search_users(self, query: str, max_results: int = 10) -> List[Dict]:
+        """Search users"""
+        return self._search_users_raw(query, max_results)
 
 
 # Global client instance
 client = JiraClient()
 
 
+def _normalize_query(query: str) -> str:
+    """Casefold and collapse whitespace so equivalent lookups share a cache entry"""
+    return " ".join(query.split()).casefold()
+
+
+@functools.lru_cache(maxsize=512)
+def _search_users_cached(norm_query: str, max_results: int) -> tuple:
+    """(displayName, accountId, accountType, active) per user; names rarely change"""
+    return tuple(
+        (u["displayName"], u["accountId"], u.get("accountType"), u.get("active"))
+        for u in client._search_users_raw(norm_query, max_results)
+    )
+
+
+_MY_TASKS_JQL = "assignee = currentUser() AND statusCategory != Done"
+_MY_TASKS_HEADER = "📋 PENDING TASKS (Board {}):"
+
+
 @mcp.tool()
 def list_my_tasks(board_id: int = 67, limit: int = 10) -> str:
     """📋 My Tasks - Show all pending tasks assigned to you"""
     try:
-        jql = "assignee = currentUser() AND statusCategory != Done"
-        issues = client.get_board_issues(board_id=board_id, jql=jql)
+        issues = client.get_board_issues(
+            board_id=board_id, jql=_MY_TASKS_JQL, max_results=limit, fields="summary,status"
+        )
         
         if not issues:
             return "No pending tasks found."
         
-        result = [f"📋 PENDING TASKS (Board {board_id}):"]
-        for issue in issues[:limit]:
-            key = issue.get("key")
-            summary = issue.get("fields", {}).get("summary")
-            status = issue.get("fields", {}).get("status", {}).get("name")
-            result.append(f"- [{key}] {summary} ({status})")
-        
-        return "\n".join(result)
+        # Both fields were requested explicitly, so Jira always returns them
+        return "\n".join(itertools.chain(
+            (_MY_TASKS_HEADER.format(board_id),),
+            (
+                f"- [{issue['key']}] {issue['fields']['summary']} ({issue['fields']['status']['name']})"
+                for issue in issues
+            )
+        ))
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -191,21 +452,7 @@ def inspect_task(issue_key: str) -> str:
         assignee = fields.get("assignee", {}).get("displayName", "Unassigned")
         summary = fields.get("summary", "No summary")
         
-        # Get description
-        desc_raw = fields.get("description", {})
-        description = "No description"
-        if isinstance(desc_raw, dict) and "content" in desc_raw:
-            try:
-                text_parts = []
-                for block in desc_raw.get("content", []):
-                    if block.get("type") == "paragraph":
-                        for node in block.get("content", []):
-                            if node.get("type") == "text":
-                                text_parts.append(node.get("text", ""))
-                if text_parts:
-                    description = " ".join(text_parts)[:200]
-            except:
-                description = "Rich text content"
+        description = _adf_text(fields.get("description"))
         
         return (
             f"🆔 {issue_key} | {status} | {priority}\n"
@@ -213,6 +460,8 @@ def inspect_task(issue_key: str) -> str:
             f"📝 Summary: {summary}\n"
             f"📄 Description: {description}"
         )
+    except JiraError as e:
+        return f"⛔ Jira Error: {e}"
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -225,31 +474,31 @@ def safe_move_task(issue_key: str, target_status: str, comment: str = None) -> s
         transitions = client.get_transitions(issue_key)
         
         # Find matching transition
-        target_normalized = target_status.lower().strip()
-        matching_trans = None
-        valid_names = []
+        target = target_status.strip().casefold()
+        matching_trans = _transitions_by_name(transitions).get(target)
         
-        for trans in transitions:
-            t_name = trans["to"]["name"]
-            valid_names.append(t_name)
-            if t_name.lower() == target_normalized:
-                matching_trans = trans
-                break
+        if not matching_trans:
+            # The issue may have moved outside the agent: drop the cached list and retry once
+            _TRANS_CACHE.pop(issue_key, None)
+            transitions = client.get_transitions(issue_key)
+            matching_trans = _transitions_by_name(transitions).get(target)
         
         if not matching_trans:
             return (
                 f"⛔ Cannot move '{issue_key}' to '{target_status}'.\n"
-                f"💡 Valid transitions: {', '.join(valid_names)}"
+                f"💡 Valid transitions: {', '.join(t['to']['name'] for t in transitions)}"
             )
         
-        # Add comment if provided
+        # Comment and transition don't depend on each other: send them together
+        futures = [_POOL.submit(client.transition_issue, issue_key, matching_trans["id"])]
         if comment:
-            client.add_comment(issue_key, f"🤖 [Agent]: {comment}")
-        
-        # Perform transition
-        client.transition_issue(issue_key, matching_trans["id"])
+            futures.append(_POOL.submit(client.add_comment, issue_key, f"🤖 [Agent]: {comment}"))
+        for future in as_completed(futures):
+            future.result()
         
         return f"✅ Successfully moved '{issue_key}' to '{matching_trans['to']['name']}'"
+    except JiraError as e:
+        return f"⛔ Jira Error: {e}"
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -261,6 +510,8 @@ def create_task(summary: str, description: str, issue_type: str = "Task") -> str
         response = client.create_issue(summary, description, issue_type)
         key = response.get("key", "Unknown")
         return f"✅ Created task {key}: {summary}"
+    except JiraError as e:
+        return f"⛔ Jira Error: {e}"
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -269,20 +520,47 @@ def create_task(summary: str, description: str, issue_type: str = "Task") -> str
 def search_colleague(name: str) -> str:
     """👥 Find Team Member - Search for colleagues by name"""
     try:
-        users = client.search_users(name)
+        users = _search_users_cached(_normalize_query(name), 10)
         if not users:
             return f"No active user found matching '{name}'"
         
         # Return first active user
-        for user in users:
-            if user.get("accountType") == "atlassian" and user.get("active"):
-                return f"Found: {user['displayName']} (ID: {user['accountId']})"
+        for display_name, account_id, account_type, active in users:
+            if account_type == "atlassian" and active:
+                return f"Found: {display_name} (ID: {account_id})"
         
         return f"No active user found matching '{name}'"
+    except JiraError as e:
+        return f"⛔ Jira Error: {e}"
     except Exception as e:
         return f"Error: {str(e)}"
 
 
+@mcp.tool()
+def diagnose_latency() -> str:
+    """⏱️ Diagnose Latency - Show p50/p95/p99 of recent Jira API calls per endpoint"""
+    if not _LATENCY_RING:
+        return "No Jira API calls recorded yet."
+    
+    samples: Dict[str, List[float]] = {}
+    for method, endpoint, elapsed in _LATENCY_RING:
+        samples.setdefault(f"{method} {endpoint}", []).append(elapsed * 1000)
+    
+    result = [f"⏱️ JIRA LATENCY (last {len(_LATENCY_RING)} calls, ms):"]
+    for name, values in sorted(samples.items()):
+        if len(values) > 1:
+            cuts = statistics.quantiles(values, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = values[0]
+        result.append(
+            f"- {name}: n={len(values)} p50={p50:.0f} p95={p95:.0f} p99={p99:.0f} "
+            f"(first={values[0]:.0f})"
+        )
+    
+    return "\n".join(result)
+
+
 @mcp.tool()
 def show_config() -> str:
     """⚙️ Show Configuration - Display current Jira settings (tokens masked)"""
@@ -301,6 +579,40 @@ def show_config() -> str:
     )
 
 
+def _write_env(env_path: Path, updates: Dict[str, str]) -> None:
+    """Apply all updates to .env in one read and one atomic write (comments are kept)"""
+    if env_path.exists():
+        lines = env_path.read_text(encoding="utf-8").splitlines()
+    else:
+        lines = ["# Jira Configuration"]
+    
+    # Rewrite every line for a key (like set_key): dotenv lets a later
+    # duplicate win, so updating only the first copy would change nothing
+    written = set()
+    for i, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if "=" in line and key in updates:
+            lines[i] = _env_line(key, updates[key])
+            written.add(key)
+    lines.extend(_env_line(key, value) for key, value in updates.items() if key not in written)
+    
+    # The file holds the API token: owner-only, as set_key leaves it
+    tmp_path = env_path.with_name(env_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with open(fd, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, env_path)
+
+
+def _env_line(key: str, value: str) -> str:
+    # Same quoting dotenv.set_key uses by default
+    escaped = value.replace("'", "\\'")
+    return f"{key}='{escaped}'"
+
+
 @mcp.tool()
 def update_config(jira_url: str = None, jira_user: str = None, jira_api_token: str = None, jira_project_key: str = None) -> str:
     """🔐 Update Configuration - Set Jira credentials and settings"""
@@ -308,39 +620,36 @@ def update_config(jira_url: str = None, jira_user: str = None, jira_api_token: s
         # Find .env file
         env_path = Path(__file__).parent / ".env"
         
-        # Create .env if it doesn't exist
-        if not env_path.exists():
-            env_path.write_text("# Jira Configuration\n")
-        
-        updated = []
-        
-        if jira_url:
-            set_key(env_path, "JIRA_URL", jira_url)
-            updated.append("JIRA_URL")
-        
-        if jira_user:
-            set_key(env_path, "JIRA_USER", jira_user)
-            updated.append("JIRA_USER")
-        
-        if jira_api_token:
-            set_key(env_path, "JIRA_API_TOKEN", jira_api_token)
-            updated.append("JIRA_API_TOKEN")
-        
-        if jira_project_key:
-            set_key(env_path, "JIRA_PROJECT_KEY", jira_project_key)
-            updated.append("JIRA_PROJECT_KEY")
+        candidates = {
+            "JIRA_URL": jira_url,
+            "JIRA_USER": jira_user,
+            "JIRA_API_TOKEN": jira_api_token,
+            "JIRA_PROJECT_KEY": jira_project_key
+        }
+        updates = {key: value for key, value in candidates.items() if value}
         
-        if not updated:
+        if not updates:
             return "⚠️ No values provided to update. Specify at least one parameter."
         
+        _write_env(env_path, updates)
+        
         return (
-            f"✅ Configuration updated: {', '.join(updated)}\n\n"
+            f"✅ Configuration updated: {', '.join(updates)}\n\n"
             f"⚠️ **Important:** You must restart Antigravity for changes to take effect."
         )
     except Exception as e:
         return f"Error updating config: {str(e)}"
 
 
+def _warm_connection() -> None:
+    """Open TCP+TLS (and negotiate HTTP/2) so the first tool call lands on a warm socket"""
+    try:
+        client.session.head("/", timeout=5)
+    except Exception:
+        pass
+
+
 if __name__ == "__main__":
+    threading.Thread(target=_warm_connection, daemon=True, name="jira-warm").start()
     mcp.run()
 
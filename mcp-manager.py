@@ -3,197 +3,444 @@
 Protonion MCP Manager - Gestiona todos tus servidores MCP
 Instalación, actualización y configuración centralizada
 """
+import functools
 import json
 import os
-import subprocess
+import re
+import shutil
 import sys
+import time
 from pathlib import Path
 
+try:
+    import orjson  # Opcional: parseo/serialización JSON más rápidos
+except ImportError:
+    orjson = None
+
 
 REGISTRY_PATH = Path.home() / ".protonion" / "mcp-registry.json"
 SERVERS_DIR = Path.home() / ".protonion" / "servers"
 ANTIGRAVITY_CONFIG = Path.home() / ".gemini" / "antigravity" / "mcp_config.json"
 
+# Ruta de `uv` resuelta una sola vez (se invoca sin shell)
+UV_BIN = shutil.which("uv") or "uv"
+
+# Servidores instalados/actualizados a la vez en install-all / update-all
+MAX_PARALLEL = 5
+
+# Límite para la suite de tests opcional de cada servidor (segundos)
+TESTS_TIMEOUT = 30
+
+# Cache de `git ls-remote` por repositorio: {url: (timestamp, sha)}
+REMOTE_HEAD_TTL = 60
+_REMOTE_HEADS = {}
+
+
+def loads_json(data):
+    """Parsear JSON desde bytes (orjson si está disponible)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj):
+    """Serializar a bytes JSON con indentación de 2 espacios"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def atomic_write_json(path, obj, durable=False):
+    """Escribir JSON en un temporal y reemplazar el destino con os.replace
+    
+    Un proceso interrumpido nunca deja el archivo a medio escribir. fsync solo
+    se hace con durable=True.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(dumps_json(obj))
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def safe_load_json(path, default):
+    """Cargar JSON tolerando ediciones manuales rotas
+    
+    Si el parseo falla, intenta con el tramo entre el primer '{' y el último '}'
+    (quita texto o ``` alrededor). Si tampoco funciona, mueve el archivo a
+    .bak y devuelve `default`.
+    """
+    raw = path.read_bytes()
+    try:
+        return loads_json(raw)
+    except ValueError:
+        pass
+    
+    text = raw.decode('utf-8', 'replace')
+    start, end = text.find('{'), text.rfind('}')
+    if start != -1 and end > start:
+        try:
+            data = loads_json(text[start:end + 1].encode('utf-8'))
+            print(f"⚠️  Recovered malformed JSON: {path}")
+            return data
+        except ValueError:
+            pass
+    
+    backup = path.with_suffix(path.suffix + '.bak')
+    os.replace(path, backup)
+    print(f"⚠️  Invalid JSON in {path}")
+    print(f"   Moved to: {backup}")
+    return default
+
 
 def load_registry():
     """Cargar el registro de servidores MCP"""
-    if not REGISTRY_PATH.exists():
+    if REGISTRY_PATH.exists():
+        registry = _load_registry(REGISTRY_PATH.stat().st_mtime_ns)
+        if registry is not None:
+            return registry
+        # Estaba corrupto y se movió a .bak: crear uno nuevo
+        _load_registry.cache_clear()
+    else:
         print(f"❌ Registry not found: {REGISTRY_PATH}")
-        print("   Creating default registry...")
-        REGISTRY_PATH.parent.mkdir(parents=True, exist_ok=True)
-        
-        default_registry = {
-            "version": "1.0",
-            "servers": {}
-        }
-        
-        REGISTRY_PATH.write_text(json.dumps(default_registry, indent=2))
-        print(f"✅ Created: {REGISTRY_PATH}")
-        return default_registry
     
-    return json.loads(REGISTRY_PATH.read_text())
+    print("   Creating default registry...")
+    REGISTRY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    
+    default_registry = {
+        "version": "1.0",
+        "servers": {}
+    }
+    
+    atomic_write_json(REGISTRY_PATH, default_registry)
+    print(f"✅ Created: {REGISTRY_PATH}")
+    return default_registry
+
+
+@functools.lru_cache(maxsize=1)
+def _load_registry(mtime_ns):
+    """Parsear el registro; se vuelve a leer solo si cambia su mtime"""
+    return safe_load_json(REGISTRY_PATH, None)
 
 
 def save_registry(registry):
     """Guardar el registro de servidores MCP"""
-    REGISTRY_PATH.write_text(json.dumps(registry, indent=2))
+    atomic_write_json(REGISTRY_PATH, registry)
+    _load_registry.cache_clear()
+
+
+def installed_dirs():
+    """Nombres de los directorios en SERVERS_DIR (un solo readdir en vez de un stat por servidor)"""
+    if not SERVERS_DIR.exists():
+        return set()
+    with os.scandir(SERVERS_DIR) as entries:
+        return {entry.name for entry in entries if entry.is_dir()}
+
+
+def parse_env(path):
+    """Leer un .env en un dict (ignora comentarios y líneas sin '=')"""
+    config = {}
+    with path.open('r', encoding='utf-8') as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line[0] == '#' or '=' not in line:
+                continue
+            key, _, value = line.partition('=')
+            config[key.strip()] = value.strip()
+    return config
 
 
-def run_command(cmd, cwd=None):
-    """Ejecutar comando y retornar resultado"""
+def run_command(cmd, cwd=None, timeout=None):
+    """Ejecutar comando y retornar resultado
+
+    `cmd` puede ser una lista de argumentos (sin shell, preferido) o un string
+    (legacy, se ejecuta con shell=True).
+    """
+    # Import diferido: `list` y `show-config` nunca lanzan procesos
+    import subprocess
+    
     try:
         result = subprocess.run(
             cmd,
-            shell=True,
+            shell=isinstance(cmd, str),
             cwd=cwd,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=timeout
         )
         return True, result.stdout
     except subprocess.CalledProcessError as e:
         return False, e.stderr
+    except subprocess.TimeoutExpired:
+        return False, f"Timed out after {timeout}s"
+    except OSError as e:
+        return False, str(e)
+
+
+@functools.lru_cache(maxsize=1)
+def git_version():
+    """Versión de git instalada como tupla (0, 0) si no se puede determinar"""
+    success, output = run_command(["git", "--version"])
+    match = re.search(r"(\d+)\.(\d+)", output) if success else None
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+def clone_flags(config):
+    """Flags de `git clone`: clon superficial salvo que el servidor pida historial completo"""
+    if config.get('full_history'):
+        return []
+    flags = ["--depth=1", "--single-branch"]
+    # Partial clone (--filter) requiere git >= 2.19
+    if git_version() >= (2, 19):
+        flags.append("--filter=blob:none")
+    return flags
+
+
+def remote_head(config, server_dir):
+    """SHA de origin/main (cacheado REMOTE_HEAD_TTL segundos por repositorio)"""
+    repository = config.get('repository', str(server_dir))
+    cached = _REMOTE_HEADS.get(repository)
+    if cached and time.monotonic() - cached[0] < REMOTE_HEAD_TTL:
+        return cached[1]
+    
+    success, output = run_command(["git", "ls-remote", "origin", "refs/heads/main"], cwd=server_dir)
+    sha = output.split()[0] if success and output.strip() else None
+    _REMOTE_HEADS[repository] = (time.monotonic(), sha)
+    return sha
+
+
+def local_head(server_dir):
+    """SHA del commit actualmente desplegado"""
+    success, output = run_command(["git", "rev-parse", "HEAD"], cwd=server_dir)
+    return output.strip() if success else None
+
+
+def is_up_to_date(config, server_dir):
+    """True si el servidor ya está en el último commit de origin/main"""
+    remote = remote_head(config, server_dir)
+    return remote is not None and remote == local_head(server_dir)
 
 
-def install_server(name, config):
+def install_server(name, config, log=print, batch=False, run_tests=False):
     """Instalar un servidor MCP"""
-    print(f"\n{'='*60}")
-    print(f"📦 Installing: {name}")
-    print(f"   {config.get('description', 'No description')}")
-    print(f"{'='*60}")
+    log(f"\n{'='*60}")
+    log(f"📦 Installing: {name}")
+    log(f"   {config.get('description', 'No description')}")
+    log(f"{'='*60}")
     
     server_dir = SERVERS_DIR / config['directory']
     
     # 1. Clonar repositorio (solo si no existe)
+    up_to_date = False
     if server_dir.exists():
-        print(f"ℹ️  Directory already exists (shared or installed): {server_dir}")
+        log(f"ℹ️  Directory already exists (shared or installed): {server_dir}")
         # Si ya existe, solo nos aseguramos de que esté actualizado
-        print("   Checking for updates...")
-        update_server(name, config)
+        log("   Checking for updates...")
+        up_to_date = is_up_to_date(config, server_dir)
+        if up_to_date:
+            log("✅ Already up-to-date")
+        else:
+            update_server(name, config, log=log, server_dir=server_dir)
     else:
-        print(f"\n[1/4] Cloning repository...")
+        log(f"\n[1/4] Cloning repository...")
         SERVERS_DIR.mkdir(parents=True, exist_ok=True)
         
         success, output = run_command(
-            f'git clone {config["repository"]} {server_dir}'
+            ["git", "clone", *clone_flags(config), config["repository"], str(server_dir)]
         )
         
         if not success:
-            print(f"❌ Failed to clone: {output}")
+            log(f"❌ Failed to clone: {output}")
             return False
         
-        print(f"✅ Cloned to: {server_dir}")
+        log(f"✅ Cloned to: {server_dir}")
     
     # 2. Instalar dependencias
-    print(f"\n[2/4] Installing dependencies...")
-    success, output = run_command("uv sync", cwd=server_dir)
-    
-    if not success:
-        print(f"⚠️  Warning: {output}")
+    log(f"\n[2/4] Installing dependencies...")
+    # Al día no basta: si nunca hubo un `uv sync` correcto no existe el .venv
+    synced = up_to_date and (server_dir / ".venv").is_dir()
+    if synced:
+        log("✅ Dependencies already synced")
     else:
-        print("✅ Dependencies installed")
+        success, output = run_command([UV_BIN, "sync"], cwd=server_dir)
+        
+        if not success:
+            log(f"⚠️  Warning: {output}")
+        else:
+            log("✅ Dependencies installed")
     
     # 3. Configurar .env
-    print(f"\n[3/4] Setting up environment...")
+    log(f"\n[3/4] Setting up environment...")
     env_template = server_dir / config.get('env_template', '.env.example')
     env_file = server_dir / '.env'
     
     if env_template.exists() and not env_file.exists():
-        import shutil
-        shutil.copy(env_template, env_file)
-        print(f"✅ Created .env from template")
+        # copyfile ya usa os.sendfile en Linux (copia en el kernel, sin buffer en Python)
+        shutil.copyfile(env_template, env_file)
+        log(f"✅ Created .env from template")
         
         if config.get('env_required'):
-            print(f"\n⚠️  Please configure these environment variables:")
+            log(f"\n⚠️  Please configure these environment variables:")
             for var in config['env_required']:
-                print(f"   - {var}")
-            print(f"\n   Edit: {env_file}")
-            input("\n   Press Enter when ready...")
-    
-    # 4. Ejecutar tests (opcional)
-    print(f"\n[4/4] Running tests...")
-    success, output = run_command("uv run pytest tests/ -q", cwd=server_dir)
-    
-    if success:
-        print("✅ Tests passed")
+                log(f"   - {var}")
+            log(f"\n   Edit: {env_file}")
+            # En modo batch no bloqueamos: se configura luego con `configure`
+            if batch:
+                log(f"   Run: python mcp-manager.py configure {name}")
+            else:
+                input("\n   Press Enter when ready...")
+    
+    # 4. Ejecutar tests (opcional: --run-tests o "run_tests": true en el registro)
+    log(f"\n[4/4] Running tests...")
+    if not (run_tests or config.get('run_tests', False)):
+        log("ℹ️  Skipped (use --run-tests to enable)")
+    elif synced:
+        log("ℹ️  No changes, skipping tests")
     else:
-        print("⚠️  Tests failed or not available")
+        success, output = run_command(
+            [UV_BIN, "run", "pytest", "tests/", "-q", "--no-header", "-x"],
+            cwd=server_dir,
+            timeout=TESTS_TIMEOUT
+        )
+        
+        if success:
+            log("✅ Tests passed")
+        else:
+            log("⚠️  Tests failed or not available")
     
-    print(f"\n✅ {name} installed successfully!")
+    log(f"\n✅ {name} installed successfully!")
     return True
 
 
-def update_server(name, config):
-    """Actualizar un servidor MCP"""
-    print(f"\n🔄 Updating: {name}")
+def update_server(name, config, log=print, server_dir=None):
+    """Actualizar un servidor MCP
     
-    server_dir = SERVERS_DIR / config['directory']
+    install_server pasa el server_dir que ya comprobó (existe y no está al día)
+    para no repetir el stat ni la comparación con el remoto.
+    """
+    log(f"\n🔄 Updating: {name}")
     
-    if not server_dir.exists():
-        print(f"❌ Server not installed: {name}")
-        return False
+    if server_dir is None:
+        server_dir = SERVERS_DIR / config['directory']
+        
+        if not server_dir.exists():
+            log(f"❌ Server not installed: {name}")
+            return False
+        
+        if is_up_to_date(config, server_dir):
+            log(f"✅ {name} already up-to-date")
+            return True
     
     # Git Fetch & Reset (Nuclear update)
-    print("Fetching and resetting to origin/main...")
-    success, output = run_command("git fetch origin && git reset --hard origin/main", cwd=server_dir)
+    log("Fetching and resetting to origin/main...")
+    if config.get('full_history'):
+        fetch, target = ["git", "fetch", "origin"], "origin/main"
+    else:
+        # Solo el último commit: el historial no hace falta para ejecutar el servidor
+        fetch, target = ["git", "fetch", "--depth=1", "origin", "main"], "FETCH_HEAD"
+    success, output = run_command(fetch, cwd=server_dir)
+    if success:
+        success, output = run_command(["git", "reset", "--hard", target], cwd=server_dir)
     
     if not success:
-        print(f"❌ Failed to update: {output}")
+        log(f"❌ Failed to update: {output}")
         return False
     
     # Update dependencies
-    print("Updating dependencies...")
-    run_command("uv sync", cwd=server_dir)
+    log("Updating dependencies...")
+    run_command([UV_BIN, "sync"], cwd=server_dir)
     
-    print(f"✅ {name} updated and synced!")
+    log(f"✅ {name} updated and synced!")
     return True
 
 
-def configure_antigravity():
+def run_parallel(task, servers):
+    """Ejecutar `task` por servidor en paralelo, imprimiendo el log de cada uno al terminar"""
+    # Import diferido: concurrent.futures solo hace falta en install-all / update-all
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    # Servidores que comparten directorio van en serie para no clonar dos veces a la vez
+    groups = {}
+    for name, config in servers:
+        groups.setdefault(config['directory'], []).append((name, config))
+    
+    def run_group(group, log):
+        for name, config in group:
+            task(name, config, log)
+    
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL) as executor:
+        futures = {}
+        for group in groups.values():
+            lines = []
+            futures[executor.submit(run_group, group, lines.append)] = lines
+        
+        for future in as_completed(futures):
+            # Cada grupo escribe en su propio buffer: la consola no se entremezcla
+            print("\n".join(futures[future]))
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Unexpected error: {e}")
+
+
+def antigravity_entry(config, server_dir):
+    """Entrada de mcpServers para un servidor instalado"""
+    # Add PYTHONPATH to ensure module imports work
+    env = {**config.get('env', {"PYTHONIOENCODING": "utf-8"}), "PYTHONPATH": "."}
+    return {
+        "command": config.get('command', 'uv'),
+        "args": ["run", "--directory", str(server_dir), *config.get('args', [])],
+        "env": env
+    }
+
+
+def configure_antigravity(registry=None):
     """Configurar Antigravity con todos los servidores"""
     print(f"\n{'='*60}")
     print("⚙️  Configuring Antigravity...")
     print(f"{'='*60}")
     
-    registry = load_registry()
+    if registry is None:
+        registry = load_registry()
     
     # Cargar config existente o crear nueva
     ANTIGRAVITY_CONFIG.parent.mkdir(parents=True, exist_ok=True)
     
     if ANTIGRAVITY_CONFIG.exists():
-        mcp_config = json.loads(ANTIGRAVITY_CONFIG.read_text())
+        mcp_config = safe_load_json(ANTIGRAVITY_CONFIG, {})
     else:
-        mcp_config = {"mcpServers": {}}
-    
-    # Agregar cada servidor
-    for name, config in registry['servers'].items():
-        if not config.get('enabled', True):
-            continue
-        
-        server_dir = SERVERS_DIR / config['directory']
-        
-        if not server_dir.exists():
+        mcp_config = {}
+    mcp_config.setdefault("mcpServers", {})
+    
+    # Agregar cada servidor habilitado e instalado
+    installed = installed_dirs()
+    enabled = {name: config for name, config in registry['servers'].items() if config.get('enabled', True)}
+    new_entries = {
+        name: antigravity_entry(config, SERVERS_DIR / directory)
+        for name, config in enabled.items()
+        if (directory := config['directory']) in installed
+    }
+    current = mcp_config['mcpServers']
+    changed = not ANTIGRAVITY_CONFIG.exists() or any(
+        current.get(name) != entry for name, entry in new_entries.items()
+    )
+    current.update(new_entries)
+    
+    for name in enabled:
+        if name in new_entries:
+            print(f"✅ Configured: {name}")
+        else:
             print(f"⚠️  Skipping {name} (not installed)")
-            continue
-        
-        # Construir args completos
-        args = config.get('args', [])
-        full_args = ["run", "--directory", str(server_dir)] + args
-        
-        # Add PYTHONPATH to ensure module imports work
-        env = config.get('env', {"PYTHONIOENCODING": "utf-8"})
-        env["PYTHONPATH"] = "."
-        
-        mcp_config['mcpServers'][name] = {
-            "command": config.get('command', 'uv'),
-            "args": full_args,
-            "env": env
-        }
-        
-        print(f"✅ Configured: {name}")
     
-    # Guardar config
-    ANTIGRAVITY_CONFIG.write_text(json.dumps(mcp_config, indent=2))
+    # Guardar config solo si alguna entrada cambió
+    if not changed:
+        print("\n✅ Antigravity config unchanged; no restart needed.")
+        return
+    
+    atomic_write_json(ANTIGRAVITY_CONFIG, mcp_config)
     print(f"\n✅ Antigravity configured: {ANTIGRAVITY_CONFIG}")
     print("\n⚠️  Restart Antigravity to apply changes")
 
@@ -211,19 +458,20 @@ def list_servers():
         print(f"Add servers to: {REGISTRY_PATH}")
         return
     
+    installed_names = installed_dirs()
     for name, config in registry['servers'].items():
-        server_dir = SERVERS_DIR / config['directory']
-        installed = "✅" if server_dir.exists() else "❌"
+        directory = config['directory']
+        installed = "✅" if directory in installed_names else "❌"
         enabled = "🟢" if config.get('enabled', True) else "🔴"
         
         print(f"{enabled} {installed} {name}")
         print(f"   {config.get('description', 'No description')}")
         print(f"   Repo: {config.get('repository', 'N/A')}")
-        print(f"   Path: {server_dir}")
+        print(f"   Path: {SERVERS_DIR / directory}")
         print()
 
 
-def install_all():
+def install_all(run_tests=False):
     """Instalar todos los servidores"""
     registry = load_registry()
     
@@ -231,11 +479,13 @@ def install_all():
     print("🚀 Installing All MCP Servers")
     print(f"{'='*60}")
     
-    for name, config in registry['servers'].items():
-        if config.get('enabled', True):
-            install_server(name, config)
+    enabled = [(name, config) for name, config in registry['servers'].items() if config.get('enabled', True)]
+    run_parallel(
+        lambda name, config, log: install_server(name, config, log=log, batch=True, run_tests=run_tests),
+        enabled
+    )
     
-    configure_antigravity()
+    configure_antigravity(registry)
 
 
 def update_all():
@@ -246,11 +496,10 @@ def update_all():
     print("🔄 Updating All MCP Servers")
     print(f"{'='*60}")
     
-    for name, config in registry['servers'].items():
-        if config.get('enabled', True):
-            update_server(name, config)
+    enabled = [(name, config) for name, config in registry['servers'].items() if config.get('enabled', True)]
+    run_parallel(update_server, enabled)
     
-    configure_antigravity()
+    configure_antigravity(registry)
 
 
 def show_config(name):
@@ -277,14 +526,7 @@ def show_config(name):
     env_example = server_dir / config.get('env_template', '.env.example')
     
     # Leer configuración actual
-    current_config = {}
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    current_config[key.strip()] = value.strip()
+    current_config = parse_env(env_file) if env_file.exists() else {}
     
     # Mostrar cada variable requerida
     env_required = config.get('env_required', [])
@@ -326,8 +568,46 @@ def show_config(name):
     print(f"  Edit manually: {env_file}")
 
 
-def configure_server(name):
-    """Configurar un servidor MCP interactivamente"""
+def parse_overrides(args):
+    """Leer valores de --from-file <archivo .env> y --set KEY=VALUE
+    
+    Devuelve None si no se pasó ninguno (modo interactivo). --set tiene
+    prioridad sobre el archivo.
+    """
+    overrides = None
+    sets = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg not in ("--set", "--from-file"):
+            # Un error de tipeo no debe dejar una variable requerida sin configurar
+            raise ValueError(f"Unknown argument: {arg}")
+        if i + 1 >= len(args) or args[i + 1].startswith("--"):
+            expected = "KEY=VALUE" if arg == "--set" else "a .env file"
+            raise ValueError(f"{arg} requires {expected}")
+        value = args[i + 1]
+        if arg == "--from-file":
+            overrides = {**(overrides or {}), **parse_env(Path(value))}
+        else:
+            sets.append(value)
+        i += 2
+    
+    for pair in sets:
+        key, sep, value = pair.partition('=')
+        if not sep or not key.strip():
+            raise ValueError(f"Invalid --set value (expected KEY=VALUE): {pair}")
+        overrides = overrides or {}
+        overrides[key.strip()] = value.strip()
+    
+    return overrides
+
+
+def configure_server(name, overrides=None):
+    """Configurar un servidor MCP
+    
+    Sin overrides pregunta cada variable requerida. Con overrides (dict de
+    --set / --from-file) no pregunta nada y termina con un informe JSON.
+    """
     registry = load_registry()
     
     if name not in registry['servers']:
@@ -354,12 +634,7 @@ def configure_server(name):
     current_config = {}
     if env_file.exists():
         print(f"📄 Found existing configuration\n")
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    current_config[key.strip()] = value.strip()
+        current_config = parse_env(env_file)
     else:
         print(f"📝 Creating new configuration\n")
     
@@ -367,7 +642,12 @@ def configure_server(name):
     env_required = config.get('env_required', [])
     new_config = {}
     
-    if env_required:
+    if overrides is not None:
+        # Modo no interactivo: aplicar todo de una vez
+        applied = sorted(overrides)
+        new_config.update(overrides)
+        skipped = [var for var in env_required if var not in new_config and not current_config.get(var)]
+    elif env_required:
         print("Please provide the following required variables:\n")
         
         for var in env_required:
@@ -407,24 +687,30 @@ def configure_server(name):
     print("Saving configuration...")
     print("="*60)
     
-    env_content = f"# {name} - MCP Server Configuration\n"
-    env_content += "# Managed by Protonion MCP Manager\n\n"
+    lines = [
+        f"# {name} - MCP Server Configuration",
+        "# Managed by Protonion MCP Manager",
+        "",
+    ]
     
     # Primero las requeridas
-    for var in env_required:
-        if var in new_config:
-            env_content += f"{var}={new_config[var]}\n"
+    lines.extend(f"{var}={new_config[var]}" for var in env_required if var in new_config)
     
     # Luego las opcionales
-    other_vars = [k for k in new_config.keys() if k not in env_required]
+    other_vars = [k for k in new_config if k not in env_required]
     if other_vars:
-        env_content += "\n# Optional variables\n"
-        for var in other_vars:
-            env_content += f"{var}={new_config[var]}\n"
+        lines.append("")
+        lines.append("# Optional variables")
+        lines.extend(f"{var}={new_config[var]}" for var in other_vars)
     
-    env_file.write_text(env_content)
+    env_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
     print(f"✅ Configuration saved to: {env_file}\n")
     
+    if overrides is not None:
+        report = {"server": name, "env_file": str(env_file), "applied": applied, "skipped": skipped}
+        print(dumps_json(report).decode("utf-8"))
+        print()
+    
     # Verificar si hay script de configuración personalizado
     custom_script = server_dir / "configure.py"
     if custom_script.exists():
@@ -447,10 +733,13 @@ def main():
         print("  mcp-manager.py list                  - List all servers")
         print("  mcp-manager.py install [name]        - Install server(s)")
         print("  mcp-manager.py install-all           - Install all servers")
+        print("      --run-tests                      - Also run each server's test suite")
         print("  mcp-manager.py update [name]         - Update server(s)")
         print("  mcp-manager.py update-all            - Update all servers")
         print("  mcp-manager.py show-config [name]    - Show server configuration")
         print("  mcp-manager.py configure [name]      - Configure server (interactive)")
+        print("      --set KEY=VALUE                  - Set a variable without prompting (repeatable)")
+        print("      --from-file [path]               - Read KEY=VALUE lines from a file")
         print("  mcp-manager.py config                - Configure Antigravity")
         print()
         print(f"Registry: {REGISTRY_PATH}")
@@ -458,12 +747,13 @@ def main():
         return
     
     command = sys.argv[1]
+    run_tests = "--run-tests" in sys.argv
     
     if command == "list":
         list_servers()
     
     elif command == "install-all":
-        install_all()
+        install_all(run_tests=run_tests)
     
     elif command == "install":
         if len(sys.argv) < 3:
@@ -477,8 +767,8 @@ def main():
             print(f"❌ Server not found: {name}")
             return
         
-        install_server(name, registry['servers'][name])
-        configure_antigravity()
+        install_server(name, registry['servers'][name], run_tests=run_tests)
+        configure_antigravity(registry)
     
     elif command == "update-all":
         update_all()
@@ -496,7 +786,7 @@ def main():
             return
         
         update_server(name, registry['servers'][name])
-        configure_antigravity()
+        configure_antigravity(registry)
     
     elif command == "show-config":
         if len(sys.argv) < 3:
@@ -510,7 +800,13 @@ def main():
             print("❌ Specify server name")
             return
         
-        configure_server(sys.argv[2])
+        try:
+            overrides = parse_overrides(sys.argv[3:])
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return
+        
+        configure_server(sys.argv[2], overrides=overrides)
     
     elif command == "config":
         configure_antigravity()
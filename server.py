@@ -12,13 +12,15 @@ mcp = FastMCP("Protonion Multi-tool Agent")
 
 # 3. Registro de Módulos de Herramientas
 # Importamos los registradores de cada servicio
-from src.mcp_tools.admin import register_admin_tools
-from src.mcp_tools.jira import register_jira_tools
-# Ejemplo futuro: from src.mcp_tools.github import register_github_tools
+from src.agents.admin import register_admin_tools
+from src.agents.jira import register_jira_tools
+from src.agents.system import register_system_tools
+# Ejemplo futuro: from src.agents.github import register_github_tools
 
 # 4. Activar herramientas por servicio
-register_admin_tools(mcp)  # Herramientas de sistema y config
-register_jira_tools(mcp)   # Herramientas de Jira
+register_admin_tools(mcp)   # Herramientas de sistema y config
+register_jira_tools(mcp)    # Herramientas de Jira
+register_system_tools(mcp)  # Herramientas de la máquina local
 # register_github_tools(mcp) # Solo tendrías que descomentar esto mañana
 
 if __name__ == "__main__":
@@ -5,17 +5,28 @@ from mcp.server.fastmcp import FastMCP
 
 from dotenv import load_dotenv
 
-# Añadir la raíz del proyecto al sys.path
+# Ejecutado como script: añadir la raíz del proyecto al sys.path.
+# Importado como src.agents.admin la raíz ya está en el path.
 ROOT_DIR = Path(__file__).parents[2]
-if str(ROOT_DIR) not in sys.path:
+if not __package__ and str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
 load_dotenv()
 
-from src.core.healthcheck import perform_health_check, format_health_report
 from src.core.config import JiraConfig
 
-load_dotenv()
+
+def _mask(value):
+    return f"{value[:4]}***" if value else "Not set"
+
+
+# Environment is loaded once at import; the tool just formats this snapshot
+_ENV_SNAPSHOT = (
+    ("JIRA_URL", os.getenv("JIRA_URL", "Not set")),
+    ("JIRA_USER", os.getenv("JIRA_USER", "Not set")),
+    ("JIRA_TOKEN", _mask(os.getenv("JIRA_API_TOKEN"))),
+    ("ENV", os.getenv("ENV", "dev")),
+)
 
 # Servidor MCP para Administración de Sistemas
 mcp = FastMCP("Protonion Admin")
@@ -23,22 +34,23 @@ mcp = FastMCP("Protonion Admin")
 @mcp.tool()
 def health_check() -> str:
     """🩺 System Status - Check connectivity and health of all Protonion services"""
-    status = perform_health_check()
+    # Import diferido: healthcheck arrastra todo jira_service
+    from src.core.healthcheck import get_cached_health, format_health_report
+
+    status = get_cached_health()
     return format_health_report(status)
 
 @mcp.tool()
 def show_environment() -> str:
     """⚙️ Environment - Show status of environment variables (masked)"""
-    def mask(v): return f"{v[:4]}***" if v else "Not set"
-    
-    report = [
-        "🌍 **Current Environment Status:**",
-        f"- JIRA_URL: {os.getenv('JIRA_URL', 'Not set')}",
-        f"- JIRA_USER: {os.getenv('JIRA_USER', 'Not set')}",
-        f"- JIRA_TOKEN: {mask(os.getenv('JIRA_API_TOKEN'))}",
-        f"- ENV: {os.getenv('ENV', 'dev')}"
-    ]
-    return "\n".join(report)
+    return "🌍 **Current Environment Status:**\n" + "\n".join(
+        f"- {label}: {value}" for label, value in _ENV_SNAPSHOT
+    )
+
+def register_admin_tools(server):
+    """Registrar las herramientas de este agente en otro servidor FastMCP"""
+    for tool in (health_check, show_environment):
+        server.add_tool(tool)
 
 if __name__ == "__main__":
     mcp.run()
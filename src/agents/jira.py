@@ -5,9 +5,10 @@ from mcp.server.fastmcp import FastMCP
 
 from dotenv import load_dotenv
 
-# Añadir la raíz del proyecto al sys.path para portabilidad extrema
+# Ejecutado como script: añadir la raíz del proyecto al sys.path.
+# Importado como src.agents.jira la raíz ya está en el path.
 ROOT_DIR = Path(__file__).parents[2]
-if str(ROOT_DIR) not in sys.path:
+if not __package__ and str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
 load_dotenv()
@@ -135,5 +136,27 @@ def search_colleague(name: str) -> str:
     except Exception as e:
         return f"Search Error: {str(e)}"
 
+# --- PROBES ---
+# Automated probes must poll jira_liveness; jira_readiness makes three Jira
+# API calls and is meant for humans or rare readiness gates.
+
+@mcp.tool()
+def jira_liveness() -> str:
+    """💓 Liveness - Constant reply proving the Jira agent process is up (no Jira calls)"""
+    return "alive"
+
+@mcp.tool()
+def jira_readiness() -> str:
+    """🩺 Readiness - Check Jira connectivity, authentication and permissions"""
+    from src.core.healthcheck import perform_health_check, format_health_report
+
+    return format_health_report(perform_health_check())
+
+def register_jira_tools(server):
+    """Registrar las herramientas de este agente en otro servidor FastMCP"""
+    for tool in (list_my_tasks, inspect_task, safe_move_task, create_task, search_colleague,
+                 jira_liveness, jira_readiness):
+        server.add_tool(tool)
+
 if __name__ == "__main__":
     mcp.run()
@@ -3,20 +3,43 @@ import sys
 from pathlib import Path
 from mcp.server.fastmcp import FastMCP
 import platform
-import psutil
+import time
 
-# Añadir la raíz del proyecto al sys.path
+# Ejecutado como script: añadir la raíz del proyecto al sys.path.
+# Importado como src.agents.system la raíz ya está en el path.
 ROOT_DIR = Path(__file__).parents[2]
-if str(ROOT_DIR) not in sys.path:
+if not __package__ and str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
 mcp = FastMCP("Protonion MCP System")
 
+# Last cpu/ram reading, refreshed at most once per second.
+# psutil is imported on the first tool call, not at module load.
+_READING_TTL = 1.0
+_READING = {"t": 0.0, "cpu": 0.0, "ram": 0.0}
+
+@mcp.tool()
+def liveness() -> str:
+    """💓 Liveness - Constant reply proving the server process is up (use this for automated probes)"""
+    return "alive"
+
 @mcp.tool()
 def get_system_brief() -> str:
     """💻 System Info - Get a quick overview of the current machine's health"""
-    cpu = psutil.cpu_percent()
-    ram = psutil.virtual_memory().percent
+    import psutil
+
+    now = time.monotonic()
+    if now - _READING["t"] > _READING_TTL:
+        # cpu_percent(interval=None) returns 0.0 on its very first call, so
+        # the first reading samples over a short interval instead.
+        interval = 0.1 if _READING["t"] == 0.0 else None
+        _READING.update(
+            t=now,
+            cpu=psutil.cpu_percent(interval=interval),
+            ram=psutil.virtual_memory().percent,
+        )
+    cpu = _READING["cpu"]
+    ram = _READING["ram"]
     os_info = f"{platform.system()} {platform.release()}"
     
     return (
@@ -26,5 +49,10 @@ def get_system_brief() -> str:
         f"- RAM Usage: {ram}%"
     )
 
+def register_system_tools(server):
+    """Registrar las herramientas de este agente en otro servidor FastMCP"""
+    for tool in (liveness, get_system_brief):
+        server.add_tool(tool)
+
 if __name__ == "__main__":
     mcp.run()
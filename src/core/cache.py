@@ -1,6 +1,7 @@
 """Caching utilities for Jira agent"""
-from functools import lru_cache, wraps
+from functools import wraps
 from typing import Any, Callable, Optional
+import threading
 import time
 
 
@@ -15,73 +16,110 @@ class TTLCache:
             ttl_seconds: Time to live in seconds (default: 5 minutes)
         """
         self.ttl_seconds = ttl_seconds
-        self._cache = {}
-        self._timestamps = {}
+        # key -> (monotonic timestamp, value); one dict probe per lookup
+        self._data = {}
+        self._data_get = self._data.get
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
-        if key not in self._cache:
+        entry = self._data_get(key)
+        if entry is None:
             return None
         
-        # Check if expired
-        if time.time() - self._timestamps[key] > self.ttl_seconds:
+        ts, value = entry
+        if time.monotonic() - ts > self.ttl_seconds:
             # Expired, remove it
-            del self._cache[key]
-            del self._timestamps[key]
+            self._data.pop(key, None)
             return None
         
-        return self._cache[key]
+        return value
     
     def set(self, key: str, value: Any) -> None:
         """Set value in cache with current timestamp"""
-        self._cache[key] = value
-        self._timestamps[key] = time.time()
+        self._data[key] = (time.monotonic(), value)
     
     def clear(self) -> None:
         """Clear all cached values"""
-        self._cache.clear()
-        self._timestamps.clear()
+        self._data.clear()
     
     def __contains__(self, key: str) -> bool:
-        """Check if key exists and is not expired"""
-        return self.get(key) is not None
+        """Check if key exists and is not expired (a cached None counts)"""
+        entry = self._data_get(key)
+        return entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds
 
 
-def ttl_cache(ttl_seconds: int = 300):
+# Separates positional from keyword arguments in ttl_cache keys
+_KWD_MARK = object()
+
+
+def _make_key(args: tuple, kwargs: dict) -> tuple:
+    # Each decorated function has its own cache, so the arguments alone
+    # are the key; the marker keeps f(a, b=1) apart from f(a, ("b", 1))
+    return args + (_KWD_MARK, *sorted(kwargs.items())) if kwargs else args
+
+
+def ttl_cache(ttl_seconds: int = 300, cardinality: Optional[Callable[[Any], int]] = None):
     """
     Decorator for caching function results with TTL.
     
     Args:
         ttl_seconds: Time to live in seconds
+        cardinality: Optional size of a result. When given, an expired entry
+            replaced by a smaller result (e.g. a list caught mid-deploy) keeps
+            the old value for one more TTL; after that the smaller result is
+            accepted.
     
     Example:
         @ttl_cache(ttl_seconds=60)
         def get_user(user_id):
             return fetch_user_from_api(user_id)
     """
-    cache = TTLCache(ttl_seconds=ttl_seconds)
-    
     def decorator(func: Callable) -> Callable:
+        # One cache per decorated function, even if the decorator is reused
+        cache = TTLCache(ttl_seconds=ttl_seconds)
+        
+        # Bound once here instead of resolved on every call
+        get = cache._data_get
+        store = cache._data.__setitem__
+        ttl = cache.ttl_seconds
+        monotonic = time.monotonic
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            cache_key = f"{func.__name__}:{args}:{kwargs}"
+            cache_key = _make_key(args, kwargs)
             
-            # Try to get from cache
-            cached_value = cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
+            # Try to get from cache (a cached None is a hit too)
+            try:
+                entry = get(cache_key)
+            except TypeError:
+                # Unhashable arguments: not cacheable
+                return func(*args, **kwargs)
+            if entry is not None and monotonic() - entry[0] <= ttl:
+                return entry[1]
             
-            # Not in cache, compute value
+            # Not in cache or expired, compute and store
             result = func(*args, **kwargs)
-            
-            # Store in cache
-            cache.set(cache_key, result)
-            
+            if (
+                cardinality is not None
+                and entry is not None
+                and len(entry) == 2  # not already extended once
+                and cardinality(result) < cardinality(entry[1])
+            ):
+                store(cache_key, (monotonic(), entry[1], True))
+                return entry[1]
+            store(cache_key, (monotonic(), result))
             return result
         
+        def cache_invalidate(*args, **kwargs):
+            """Drop the entry for these arguments, if any"""
+            try:
+                cache._data.pop(_make_key(args, kwargs), None)
+            except TypeError:
+                pass
+        
         # Add cache control methods
         wrapper.cache_clear = cache.clear
+        wrapper.cache_invalidate = cache_invalidate
         wrapper.cache = cache
         
         return wrapper
@@ -94,11 +132,19 @@ user_cache = TTLCache(ttl_seconds=600)  # 10 minutes for user data
 config_cache = TTLCache(ttl_seconds=3600)  # 1 hour for config
 
 
-@lru_cache(maxsize=1)
+_client_singleton = None
+_client_lock = threading.Lock()
+
+
 def get_singleton_client():
     """
     Get singleton Jira client instance.
-    Uses LRU cache with maxsize=1 to create only one instance.
+    Once created, returns a module global: one branch, no lock, no hashing.
     """
-    from src.services.jira_service import JiraClient
-    return JiraClient()
+    global _client_singleton
+    if _client_singleton is None:
+        with _client_lock:
+            if _client_singleton is None:
+                from src.services.jira_service import JiraClient
+                _client_singleton = JiraClient()
+    return _client_singleton
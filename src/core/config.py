@@ -12,6 +12,7 @@ class JiraConfig:
     EMAIL = os.getenv("JIRA_EMAIL", "").strip()
     API_TOKEN = os.getenv("JIRA_API_TOKEN", "").strip()
     PROJECT_KEY = os.getenv("JIRA_PROJECT_KEY", "CRM").strip()
+    AUTH = (EMAIL, API_TOKEN)
     
     # API endpoints
     API_VERSION = "3"
@@ -26,4 +27,4 @@ class JiraConfig:
     @classmethod
     def get_auth(cls) -> tuple:
         """Return authentication tuple for requests"""
-        return (cls.EMAIL, cls.API_TOKEN)
+        return cls.AUTH
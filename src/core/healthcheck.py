@@ -1,10 +1,31 @@
 """Health check utilities for Jira agent"""
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
+try:
+    import orjson  # Optional: C-level JSON encoding
+except ImportError:
+    orjson = None
 
-@dataclass
+# Indexed by is_healthy
+_STATUS_EMOJI = ("⛔", "✅")
+
+# Overall deadline for the network checks; a slow call is reported as failed.
+# Each request also gets it as its socket timeout, so a check thread left
+# behind by a stalled Jira still finishes in bounded time.
+CHECK_TIMEOUT = 2.0
+
+# Last health check result, served while a background refresh runs
+HEALTH_TTL = 10.0
+_health_cache = {"status": None, "updated_at": 0.0}
+_refresh_lock = threading.Lock()
+
+
+@dataclass(slots=True)
 class HealthStatus:
     """Health check status"""
     config: bool = False
@@ -15,19 +36,28 @@ class HealthStatus:
     @property
     def is_healthy(self) -> bool:
         """Check if all components are healthy"""
-        return all([self.config, self.api_connectivity, self.authentication])
+        return self.config and self.api_connectivity and self.authentication
     
     @property
     def status_emoji(self) -> str:
         """Get emoji representation of health"""
-        return "✅" if self.is_healthy else "⛔"
+        return _STATUS_EMOJI[self.is_healthy]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return asdict(self)
+        # Flat bools: no need for asdict's recursive deep copy
+        return {
+            "config": self.config,
+            "api_connectivity": self.api_connectivity,
+            "authentication": self.authentication,
+            "permissions": self.permissions,
+        }
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string"""
+        # orjson only indents by 2 spaces; other widths use the stdlib
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=indent)
 
 
@@ -39,7 +69,7 @@ def perform_health_check() -> HealthStatus:
         HealthStatus object with results
     """
     from src.core.config import JiraConfig
-    from src.services.jira_service import JiraClient
+    from src.core.cache import get_singleton_client
     
     status = HealthStatus()
     
@@ -53,33 +83,78 @@ def perform_health_check() -> HealthStatus:
     if not status.config:
         return status
     
-    # 2. Check API Connectivity
+    # 2-4. Connectivity, authentication and permissions are independent,
+    # so run them concurrently: the probe takes as long as the slowest call.
+    # Shared client: its session keeps the connection to Jira alive between probes
+    client = get_singleton_client()
+    checks = {
+        "api_connectivity": lambda: client.server_info(timeout=CHECK_TIMEOUT),
+        "authentication": lambda: client.current_user(timeout=CHECK_TIMEOUT),
+        # Basic permission; optional, won't fail the health check
+        "permissions": lambda: client.get_issues(
+            jql='PROJECT is not EMPTY', max_results=1, timeout=CHECK_TIMEOUT
+        ),
+    }
+    # One thread per check for this probe only: overlapping probes never queue
+    # behind each other, so every check starts right away and the deadline
+    # measures Jira, not a backlog
+    pool = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="healthcheck")
     try:
-        client = JiraClient()
-        # Try to get server info
-        info = client.jira.server_info()
-        status.api_connectivity = bool(info)
-    except Exception:
-        status.api_connectivity = False
-        return status  # Can't continue without connectivity
+        futures = {pool.submit(check): name for name, check in checks.items()}
+        done, _ = wait(futures, timeout=CHECK_TIMEOUT)
+    finally:
+        pool.shutdown(wait=False)
+    
+    for future in done:
+        try:
+            result = future.result()
+        except Exception:
+            continue
+        name = futures[future]
+        # Permissions only need the search to succeed, even with no results
+        setattr(status, name, True if name == "permissions" else bool(result))
     
-    # 3. Check Authentication
+    return status
+
+
+def _store_health() -> HealthStatus:
+    status = perform_health_check()
+    _health_cache["status"] = status
+    _health_cache["updated_at"] = time.monotonic()
+    return status
+
+
+def _refresh() -> None:
+    """Background refresh; releases the lock taken by get_cached_health"""
     try:
-        # Try to get current user
-        user = client.jira.current_user()
-        status.authentication = bool(user)
-    except Exception:
-        status.authentication = False
-        return status
+        _store_health()
+    finally:
+        _refresh_lock.release()
+
+
+def get_cached_health(ttl: float = HEALTH_TTL) -> HealthStatus:
+    """
+    Return the last health status, refreshing it in the background when stale.
     
-    # 4. Check Permissions (optional, won't fail health check)
-    try:
-        # Try to search for issues (basic permission)
-        client.jira.search_issues('PROJECT is not EMPTY', maxResults=1)
-        status.permissions = True
-    except Exception:
-        status.permissions = False
+    Only the very first call waits for the Jira round-trips; afterwards callers
+    get the cached status immediately and at most one refresh runs at a time.
+    
+    Args:
+        ttl: Seconds before a cached status is considered stale
+    
+    Returns:
+        HealthStatus object with results
+    """
+    status = _health_cache["status"]
+    if status is None:
+        with _refresh_lock:
+            status = _health_cache["status"]
+            if status is None:
+                status = _store_health()
+        return status
     
+    if time.monotonic() - _health_cache["updated_at"] > ttl and _refresh_lock.acquire(blocking=False):
+        threading.Thread(target=_refresh, name="healthcheck-refresh", daemon=True).start()
     return status
 
 
@@ -1,6 +1,6 @@
 
-import re
-from .validators import ValidationError
+from typing import Any
+from .validators import ValidationError, is_issue_key
 
 def validate_issue_key(issue_key: str) -> str:
     """Valida formato CRM-123"""
@@ -8,9 +8,7 @@ def validate_issue_key(issue_key: str) -> str:
         raise ValidationError("Issue key must be a non-empty string")
     
     issue_key = issue_key.strip().upper()
-    pattern = r'^[A-Z]{2,10}-\d{1,10}$'
-    
-    if not re.match(pattern, issue_key):
+    if not is_issue_key(issue_key, min_project_len=2):
         raise ValidationError(f"Invalid issue key format: '{issue_key}'. Expected PROJECT-NUMBER (e.g. CRM-123)")
     return issue_key
 
@@ -1,13 +1,42 @@
 """Input validation utilities for Jira agent"""
-import re
+import string
+from functools import lru_cache
 from typing import Optional
 
+_COMMON_STATUSES = frozenset({
+    "Done", "In Progress", "To Do", "Backlog", "Selected for Development",
+    "In Review", "Blocked", "Cancelled",
+})
+
+# Deletes every allowed status character but whitespace; the scan runs in C
+_STATUS_STRIP_ALNUM = str.maketrans('', '', string.ascii_letters + string.digits)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
 
+def is_issue_key(key: str, min_project_len: int = 1) -> bool:
+    """
+    Check the PROJECT-NUMBER shape without a regex.
+    
+    Project: min_project_len-10 ASCII uppercase letters
+    Number: 1-10 digits
+    """
+    # Cheap rejection before looking at characters
+    if not min_project_len + 2 <= len(key) <= 21 or key.count('-') != 1:
+        return False
+    
+    project, _, number = key.partition('-')
+    return (
+        min_project_len <= len(project) <= 10
+        and project.isascii() and project.isalpha() and project.isupper()
+        and 1 <= len(number) <= 10
+        and number.isdecimal()
+    )
+
+
 def validate_issue_key(issue_key: str) -> str:
     """
     Validate and sanitize Jira issue key.
@@ -28,11 +57,7 @@ def validate_issue_key(issue_key: str) -> str:
     issue_key = issue_key.strip()
     
     # Validate format: PROJECT-NUMBER
-    # Project: 1-10 uppercase letters
-    # Number: 1-10 digits
-    pattern = r'^[A-Z]{1,10}-\d{1,10}$'
-    
-    if not re.match(pattern, issue_key):
+    if not is_issue_key(issue_key):
         raise ValidationError(
             f"Invalid issue key format: '{issue_key}'. "
             f"Expected format: PROJECT-NUMBER (e.g., 'CRM-123')"
@@ -57,13 +82,25 @@ def validate_status(status: str) -> str:
     if not status or not isinstance(status, str):
         raise ValidationError("Status must be a non-empty string")
     
+    # Canonical Jira statuses are already valid as-is
+    if status in _COMMON_STATUSES:
+        return status
+    
+    return _validate_status_text(status)
+
+
+@lru_cache(maxsize=256)
+def _validate_status_text(status: str) -> str:
+    """Strip and check a status string; repeated inputs are served from the cache"""
     status = status.strip()
     
     # Status should be alphanumeric + spaces, max 50 chars
     if len(status) > 50:
         raise ValidationError(f"Status name too long (max 50 chars): '{status}'")
     
-    if not re.match(r'^[a-zA-Z0-9\s]+$', status):
+    # Whatever survives the table must be whitespace
+    rest = status.translate(_STATUS_STRIP_ALNUM)
+    if not status or (rest and not rest.isspace()):
         raise ValidationError(
             f"Invalid status format: '{status}'. "
             f"Only alphanumeric characters and spaces allowed"
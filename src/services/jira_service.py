@@ -1,18 +1,100 @@
 """
 Jira API Client with Clean Architecture Principles
 """
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Any
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding of API bodies
+except ImportError:
+    orjson = None
 from src.core.config import JiraConfig
+from src.core.cache import ttl_cache
+from src.core.validators import validate_issue_key
+
+# Mounted on every client session so they all draw from one connection pool:
+# a new JiraClient reuses open keep-alive connections instead of re-handshaking.
+# Retry only covers idempotent methods (urllib3 default), never a POST.
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+)
 # from src.core.models import IssueDigest, IssueTransition # Comentamos modelos si no existen aun
 
+# stdout carries the MCP protocol; diagnostics go through logging (stderr)
+logger = logging.getLogger(__name__)
+
+
+class _BodyText:
+    """Defers decoding a response body until a log record is actually emitted"""
+    __slots__ = ("response",)
+
+    def __init__(self, response):
+        self.response = response
+
+    def __str__(self) -> str:
+        return self.response.text
+
+
+# Max characters of description/comment text kept in an issue digest
+DIGEST_TEXT_LIMIT = 300
+
+# The only fields get_issue_digest reads; asking for just these avoids
+# downloading every custom field, worklog and changelog of the issue
+DIGEST_FIELDS = ["summary", "status", "priority", "assignee", "description", "comment"]
+
+
+def _adf_text_stream(node: Any):
+    """Yield the text of every text node in an Atlassian Document Format tree"""
+    if isinstance(node, dict):
+        if node.get("type") == "text":
+            yield node.get("text", "")
+        for child in node.get("content", ()):
+            yield from _adf_text_stream(child)
+    elif isinstance(node, list):
+        for child in node:
+            yield from _adf_text_stream(child)
+
+
+def _adf_snippet(doc: Any, limit: int) -> str:
+    """First `limit` characters of an ADF document's text; stops walking once reached"""
+    parts = []
+    total = 0
+    for text in _adf_text_stream(doc):
+        parts.append(text)
+        total += len(text) + 1
+        if total >= limit:
+            break
+    return " ".join(parts)[:limit]
+
+
+def _match_transition(transitions_resp: Dict, target_normalized: str):
+    """Return (available transitions, the one reaching target_normalized or None)"""
+    available = transitions_resp.get("transitions", [])
+    # Built in reverse so the first transition wins on duplicate names
+    by_name = {t["to"]["name"].lower(): t for t in reversed(available)}
+    return available, by_name.get(target_normalized)
+
+
 class JiraClient:
     """Client for interacting with Jira API"""
     
     def __init__(self):
         self.config = JiraConfig
         self.session = requests.Session()
+        self.session.mount("https://", _SHARED_ADAPTER)
+        self.session.mount("http://", _SHARED_ADAPTER)
         self.session.auth = self.config.get_auth()
+        self._api_base = self.config.API_BASE + "/"
         self.session.headers.update({
             "Accept": "application/json",
             "Content-Type": "application/json"
@@ -23,71 +105,92 @@ class JiraClient:
         method: str, 
         endpoint: str, 
         data: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None
     ) -> Dict:
-        """Make a request to Jira API"""
-        url = f"{self.config.API_BASE}/{endpoint}"
+        """Make a request to Jira API (timeout: seconds per connect/read, None waits)"""
+        url = self._api_base + endpoint
+        # The session already sends Content-Type: application/json
+        body = {"json": data} if orjson is None or data is None else {"data": orjson.dumps(data)}
         
         try:
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data,
-                params=params
+                params=params,
+                timeout=timeout,
+                **body
             )
             # Jira specific error handling
             if response.status_code == 400:
-                print(f"Jira Validation Error: {response.text}")
+                logger.warning("Jira Validation Error: %s", _BodyText(response))
             elif response.status_code == 404:
-                print(f"Jira Resource Not Found: {url}")
+                logger.warning("Jira Resource Not Found: %s", url)
                 
             response.raise_for_status()
-            return response.json() if response.content else {}
+            # Transitions and similar POSTs answer 204 No Content
+            if response.status_code == 204 or response.headers.get("Content-Length") == "0":
+                return {}
+            try:
+                return orjson.loads(response.content) if orjson is not None else response.json()
+            except ValueError:
+                # Empty body without a Content-Length (chunked); anything else is a real error
+                if not response.content:
+                    return {}
+                raise
         except requests.exceptions.RequestException as e:
-            print(f"Jira API Error: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
+            logger.error("Jira API Error: %s", e)
+            if e.response is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response: %s", e.response.text)
             raise
     
     # --- Clean Architecture / Robust Methods ---
 
     def get_issue_digest(self, issue_key: str) -> Dict:
         """Get a curated, token-efficient summary of an issue"""
-        issue = self.get_issue(issue_key)
+        return self._digest(self.get_issue(issue_key, fields=DIGEST_FIELDS))
+
+    def get_issue_digests(self, issue_keys: List[str]) -> List[Dict]:
+        """Digests for several issues with a single search instead of one GET per issue"""
+        # Keys are interpolated into JQL, so each one must be a plain PROJECT-NUMBER
+        keys = list(dict.fromkeys(validate_issue_key(key) for key in issue_keys))
+        if not keys:
+            return []
+        payload = {
+            "jql": f"key in ({','.join(keys)})",
+            "maxResults": min(len(keys), 100),
+            "fields": DIGEST_FIELDS
+        }
+        digests = []
+        # search/jql may return fewer issues than asked for; follow nextPageToken
+        while True:
+            result = self._make_request("POST", "search/jql", data=payload)
+            digests.extend(self._digest(issue) for issue in result.get("issues", []))
+            token = result.get("nextPageToken")
+            if not token or result.get("isLast", False):
+                return digests
+            payload["nextPageToken"] = token
+
+    @staticmethod
+    def _digest(issue: Dict) -> Dict:
         fields = issue.get("fields", {})
         
-        # Extract text from Atlassian Doc format if possible user helper
         description = "No description"
         desc_raw = fields.get("description")
         if desc_raw and isinstance(desc_raw, dict):
-            # Very naive extraction of text from ADF
-            content = desc_raw.get("content", [])
-            if content and len(content) > 0:
-                text_parts = []
-                for p in content:
-                     if p.get("type") == "paragraph":
-                         for node in p.get("content", []):
-                             if node.get("type") == "text":
-                                 text_parts.append(node.get("text", ""))
-                description = " ".join(text_parts)[:300] + "..." if text_parts else "Complex content"
+            text = _adf_snippet(desc_raw, DIGEST_TEXT_LIMIT)
+            description = text + "..." if text else "Complex content"
         elif isinstance(desc_raw, str):
-            description = desc_raw[:300]
+            description = desc_raw[:DIGEST_TEXT_LIMIT]
 
         comments_data = fields.get("comment", {}).get("comments", [])
         last_comment = None
         if comments_data:
             last_body = comments_data[-1].get("body", {})
-            # Naive extraction again
-            try:
-                # Try to get text from ADF
-                last_comment = "Rich Text Comment" # Placeholder implementation for complex ADF
-                if isinstance(last_body, dict) and "content" in last_body:
-                     content = last_body["content"][0]["content"][0]["text"]
-                     last_comment = content
-                elif isinstance(last_body, str):
-                    last_comment = last_body
-            except:
-                last_comment = "Rich text comment (could not parse)"
+            if isinstance(last_body, dict):
+                last_comment = _adf_snippet(last_body, DIGEST_TEXT_LIMIT) or "Rich Text Comment"
+            elif isinstance(last_body, str):
+                last_comment = last_body
 
         return {
             "key": issue.get("key"),
@@ -100,32 +203,38 @@ class JiraClient:
             "last_comment": last_comment
         }
 
+    @ttl_cache(ttl_seconds=60, cardinality=lambda resp: len(resp.get("transitions", ())))
+    def _get_transitions(self, issue_key: str) -> Dict:
+        """Legal transitions from the issue's current status"""
+        return self._make_request("GET", f"issue/{issue_key}/transitions")
+
     def safe_transition(self, issue_key: str, target_status: str) -> Dict:
         """
         Robust transition that validates workflow first.
         Returns detailed success or failure context.
         """
-        # 1. Introspection: Get legal transitions
+        # 1. Introspection: Get legal transitions (cached per issue)
         try:
-            transitions_resp = self._make_request("GET", f"issue/{issue_key}/transitions")
+            transitions_resp = self._get_transitions(issue_key)
         except Exception:
             return {"success": False, "error": "Issue Not Found or No Permission"}
 
-        available_transitions = transitions_resp.get("transitions", [])
-        
-        # 2. Validation
+        # 2. Validation: one dict lookup instead of scanning every transition
         target_normalized = target_status.lower().strip()
-        matching_trans = None
+        available_transitions, matching_trans = _match_transition(transitions_resp, target_normalized)
         
-        valid_names = []
-        for t in available_transitions:
-            t_name = t["to"]["name"]
-            valid_names.append(t_name)
-            if t_name.lower() == target_normalized:
-                matching_trans = t
-                break
+        if not matching_trans:
+            # The cached list may predate a status change made outside the
+            # agent: drop it and check once more against a fresh one
+            self._get_transitions.cache_invalidate(self, issue_key)
+            try:
+                transitions_resp = self._get_transitions(issue_key)
+            except Exception:
+                return {"success": False, "error": "Issue Not Found or No Permission"}
+            available_transitions, matching_trans = _match_transition(transitions_resp, target_normalized)
         
         if not matching_trans:
+            valid_names = [t["to"]["name"] for t in available_transitions]
             return {
                 "success": False,
                 "error": "Invalid Transition",
@@ -137,12 +246,16 @@ class JiraClient:
         data = {"transition": {"id": matching_trans["id"]}}
         try:
             self._make_request("POST", f"issue/{issue_key}/transitions", data=data)
+            # The issue has a new status, so its legal transitions changed too
+            self._get_transitions.cache_invalidate(self, issue_key)
             return {
                 "success": True,
                 "message": f"Successfully moved '{issue_key}' to '{matching_trans['to']['name']}'",
                 "new_status": matching_trans['to']['name']
             }
         except Exception as e:
+            # The cached list may be out of date; fetch it fresh next time
+            self._get_transitions.cache_invalidate(self, issue_key)
             return {
                 "success": False,
                 "error": "Execution Error",
@@ -167,6 +280,14 @@ class JiraClient:
 
     # --- Standard Methods ---
     
+    def server_info(self, timeout: Optional[float] = None) -> Dict:
+        """Get Jira server information (reachable without valid credentials)"""
+        return self._make_request("GET", "serverInfo", timeout=timeout)
+    
+    def current_user(self, timeout: Optional[float] = None) -> Dict:
+        """Get the authenticated user"""
+        return self._make_request("GET", "myself", timeout=timeout)
+    
     def get_project(self, project_key: Optional[str] = None) -> Dict:
         """Get project information"""
         key = project_key or self.config.PROJECT_KEY
@@ -184,10 +305,10 @@ class JiraClient:
             response.raise_for_status()
             return response.json().get("issues", [])
         except requests.exceptions.RequestException as e:
-            print(f"Jira Agile API Error: {e}")
+            logger.error("Jira Agile API Error: %s", e)
             return []
 
-    def get_issues(self, project_key: Optional[str] = None, jql: Optional[str] = None, max_results: int = 50) -> List[Dict]:
+    def get_issues(self, project_key: Optional[str] = None, jql: Optional[str] = None, max_results: int = 50, timeout: Optional[float] = None) -> List[Dict]:
         key = project_key or self.config.PROJECT_KEY
         if not jql:
             jql = f"project = {key} ORDER BY created DESC"
@@ -200,11 +321,12 @@ class JiraClient:
         }
         
         # Ensure we use search/jql endpoint which is replacing standard search in some tenants
-        result = self._make_request("POST", "search/jql", data=payload)
+        result = self._make_request("POST", "search/jql", data=payload, timeout=timeout)
         return result.get("issues", [])
     
-    def get_issue(self, issue_key: str) -> Dict:
-        return self._make_request("GET", f"issue/{issue_key}")
+    def get_issue(self, issue_key: str, fields: Optional[List[str]] = None) -> Dict:
+        params = {"fields": ",".join(fields)} if fields else None
+        return self._make_request("GET", f"issue/{issue_key}", params=params)
     
     def create_issue(self, summary: str, description: str, issue_type: str = "Task", project_key: Optional[str] = None, priority: Optional[str] = None, assignee: Optional[str] = None) -> Dict:
         key = project_key or self.config.PROJECT_KEY
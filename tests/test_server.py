@@ -7,7 +7,7 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.jira_tools.validators import (
+from src.core.validators import (
     validate_issue_key,
     validate_status,
     validate_board_id,
@@ -96,7 +96,7 @@ class TestCaching:
     
     def test_ttl_cache(self):
         """Test TTL cache"""
-        from src.jira_tools.cache import TTLCache
+        from src.core.cache import TTLCache
         
         cache = TTLCache(ttl_seconds=1)
         
@@ -114,7 +114,7 @@ class TestCaching:
     def test_ttl_cache_expiration(self):
         """Test TTL cache expiration"""
         import time
-        from src.jira_tools.cache import TTLCache
+        from src.core.cache import TTLCache
         
         cache = TTLCache(ttl_seconds=0.1)  # 100ms TTL
         
@@ -126,6 +126,53 @@ class TestCaching:
         
         # Should be expired
         assert cache.get("key1") is None
+    
+    def test_ttl_cache_cardinality_extends_once(self):
+        """Test a smaller result is only held off for one extra TTL"""
+        import time
+        from src.core.cache import ttl_cache
+        
+        source = {"items": [1, 2, 3]}
+        
+        @ttl_cache(ttl_seconds=0.05, cardinality=len)
+        def fetch(key):
+            return list(source["items"])
+        
+        assert fetch("k") == [1, 2, 3]
+        
+        # Shrinks: the richer value is kept for one more TTL
+        source["items"] = [1]
+        time.sleep(0.1)
+        assert fetch("k") == [1, 2, 3]
+        
+        # Still smaller after the extension: accepted
+        time.sleep(0.1)
+        assert fetch("k") == [1]
+    
+    def test_safe_transition_refetches_stale_transitions(self):
+        """Test an issue moved outside the agent doesn't keep its old transitions"""
+        from src.services.jira_service import JiraClient
+        
+        client = JiraClient()
+        before = {"transitions": [
+            {"id": "11", "to": {"name": "In Progress"}},
+            {"id": "21", "to": {"name": "Done"}},
+            {"id": "31", "to": {"name": "Blocked"}},
+        ]}
+        after = {"transitions": [{"id": "41", "to": {"name": "Reopened"}}]}
+        responses = [before, after]
+        
+        def fake_request(method, endpoint, data=None, params=None):
+            return responses.pop(0) if method == "GET" else {}
+        
+        with patch.object(client, "_make_request", side_effect=fake_request) as request:
+            # Caches the To Do transitions; meanwhile the issue is moved to Done in Jira
+            client._get_transitions("CRM-1")
+            result = client.safe_transition("CRM-1", "Reopened")
+        
+        assert result["success"] is True
+        assert request.call_args.args[:2] == ("POST", "issue/CRM-1/transitions")
+        assert request.call_args.kwargs["data"] == {"transition": {"id": "41"}}
 
 
 class TestHealthCheck:
@@ -133,7 +180,7 @@ class TestHealthCheck:
     
     def test_health_status_healthy(self):
         """Test healthy status"""
-        from src.jira_tools.healthcheck import HealthStatus
+        from src.core.healthcheck import HealthStatus
         
         status = HealthStatus(
             config=True,
@@ -147,7 +194,7 @@ class TestHealthCheck:
     
     def test_health_status_unhealthy(self):
         """Test unhealthy status"""
-        from src.jira_tools.healthcheck import HealthStatus
+        from src.core.healthcheck import HealthStatus
         
         status = HealthStatus(
             config=False,
@@ -160,7 +207,7 @@ class TestHealthCheck:
     
     def test_format_health_report(self):
         """Test health report formatting"""
-        from src.jira_tools.healthcheck import HealthStatus, format_health_report
+        from src.core.healthcheck import HealthStatus, format_health_report
         
         status = HealthStatus(
             config=True,